@@ -28,7 +28,7 @@ if [ "$PYTHON_MAJOR" -lt 3 ] || ([ "$PYTHON_MAJOR" -eq 3 ] && [ "$PYTHON_MINOR"
     echo "❌ Error: VoiceType requires Python >=3.10, <3.14"
     echo "   Current version: $PYTHON_VERSION"
     echo ""
-    echo "   Note: Python 3.14 is not yet supported due to numba dependency limitations."
+    echo "   Note: Python 3.14 is not yet supported by all of VoiceType's dependencies."
     echo ""
     echo "   Please install a compatible Python version:"
     echo "   - Python 3.10, 3.11, 3.12, or 3.13"
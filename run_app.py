@@ -7,7 +7,7 @@ import sys
 if sys.version_info < (3, 10) or sys.version_info >= (3, 14):
     print(f"❌ Error: VoiceType requires Python >=3.10, <3.14")
     print(f"   Current version: {sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}")
-    print(f"\n   Note: Python 3.14 is not yet supported due to numba dependency limitations.")
+    print(f"\n   Note: Python 3.14 is not yet supported by all of VoiceType's dependencies.")
     print(f"\n   Please install a compatible Python version:")
     print(f"   - Python 3.10, 3.11, 3.12, or 3.13")
     print(f"   - Using pyenv: pyenv install 3.13")
@@ -47,7 +47,7 @@ done
 if [ -z "$PYTHON_CMD" ]; then
     echo "❌ No compatible Python version found (>=3.10, <3.14)"
     echo ""
-    echo "   Note: Python 3.14 is not yet supported due to numba dependency limitations."
+    echo "   Note: Python 3.14 is not yet supported by all of VoiceType's dependencies."
     echo ""
     echo "🔧 Attempting to install Python 3.13..."
     
@@ -152,7 +152,7 @@ echo ""
 echo "⬆️  Upgrading pip..."
 python -m pip install --upgrade pip --quiet
 
-# Check for build tools (needed for numba)
+# Check for build tools (needed if a dependency has to be built from source)
 echo ""
 echo "🔧 Checking for build tools..."
 if [[ "$OSTYPE" == "darwin"* ]]; then
@@ -188,16 +188,16 @@ pip install -r requirements.txt || {
             echo "   1. Ensure Xcode Command Line Tools are installed:"
             echo "      xcode-select --install"
             echo ""
-            echo "   2. Try installing numba separately first:"
-            echo "      pip install numba"
+            echo "   2. Install the CTranslate2 wheel on its own first:"
+            echo "      pip install --only-binary=:all: ctranslate2"
             echo "      pip install -r requirements.txt"
         else
             echo "   1. Install build essentials:"
             echo "      - Ubuntu/Debian: sudo apt-get install build-essential"
             echo "      - Fedora: sudo dnf install gcc gcc-c++"
             echo ""
-            echo "   2. Try installing numba separately first:"
-            echo "      pip install numba"
+            echo "   2. Install the CTranslate2 wheel on its own first:"
+            echo "      pip install --only-binary=:all: ctranslate2"
             echo "      pip install -r requirements.txt"
         fi
         exit 1
@@ -10,32 +10,75 @@ import sys
 if sys.version_info < (3, 10) or sys.version_info >= (3, 14):
     print(f"❌ Error: VoiceType requires Python >=3.10, <3.14")
     print(f"   Current version: {sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}")
-    print(f"\n   Note: Python 3.14 is not yet supported due to numba dependency limitations.")
+    print(f"\n   Note: Python 3.14 is not yet supported by all of VoiceType's dependencies.")
     print(f"\n   Please install a compatible Python version:")
     print(f"   - Python 3.10, 3.11, 3.12, or 3.13")
     print(f"   - Using pyenv: pyenv install 3.13")
     print(f"   - Using Homebrew: brew install python@3.13")
     sys.exit(1)
 
-import whisper
+from faster_whisper import WhisperModel, download_model
+import ctranslate2
 import sounddevice as sd
 import soundfile as sf
 import argparse
 import numpy as np
 from pathlib import Path
-import tempfile
+from dataclasses import dataclass, asdict
+from typing import Optional
+from scipy.signal import resample_poly
 import os
-import warnings
+import platform
+import importlib.util
 import threading
 import time
 import subprocess
+import queue
+import io
+from concurrent.futures import ThreadPoolExecutor
 import atexit
 import signal
 from pynput import keyboard
 from pynput.keyboard import Controller, Key
+from voicetype_qos import set_thread_qos
 
-# Suppress FP16 warning (harmless - uses FP32 on CPU)
-warnings.filterwarnings("ignore", message="FP16 is not supported on CPU")
+# Native clipboard / keystroke APIs (pulled in with pynput on macOS)
+try:
+    from AppKit import NSPasteboard, NSPasteboardTypeString
+    import Quartz
+except ImportError:
+    NSPasteboard = None
+    Quartz = None
+
+# Hugging Face repos with MLX-converted Whisper weights, by model size
+_MLX_MODEL_REPOS = {
+    "tiny": "mlx-community/whisper-tiny-mlx",
+    "base": "mlx-community/whisper-base-mlx",
+    "small": "mlx-community/whisper-small-mlx",
+    "medium": "mlx-community/whisper-medium-mlx",
+    "large": "mlx-community/whisper-large-v3-mlx",
+}
+
+# Local copy of the CTranslate2 Whisper weights, one directory per model size
+if sys.platform == "darwin":
+    MODEL_CACHE_DIR = Path.home() / "Library" / "Caches" / "voicetype"
+else:
+    MODEL_CACHE_DIR = Path.home() / ".cache" / "voicetype"
+
+# Marker logged after each script sent to the osascript coprocess
+_OSA_DONE = "__VOICETYPE_OSA_DONE__"
+
+# Virtual key code of 'v' on an ANSI layout (kVK_ANSI_V)
+_KEYCODE_V = 9
+
+# Maximum UTF-16 units CGEventKeyboardSetUnicodeString delivers per event
+_UNICODE_CHUNK = 20
+
+# Sample rate expected by Whisper's feature extractor
+WHISPER_SAMPLE_RATE = 16000
+
+# Initial capture buffer length; grows by doubling for longer recordings
+RECORD_BUFFER_SECONDS = 120
 
 # Lock file for single-instance enforcement
 LOCK_FILE = Path.home() / ".voicetype.lock"
@@ -93,22 +136,137 @@ def _release_lock():
             pass
 
 
-# Register cleanup on exit
-atexit.register(_release_lock)
-
 def _signal_handler(signum, frame):
     _release_lock()
     raise SystemExit(0)
 
-signal.signal(signal.SIGTERM, _signal_handler)
+
+def _set_clipboard(text):
+    """Replace the general pasteboard contents with text."""
+    pasteboard = NSPasteboard.generalPasteboard()
+    pasteboard.clearContents()
+    if not pasteboard.setString_forType_(text, NSPasteboardTypeString):
+        raise RuntimeError("NSPasteboard rejected the string")
+
+
+def _post_cmd_v():
+    """Post a Cmd+V key press/release pair to the HID event tap."""
+    for key_down in (True, False):
+        event = Quartz.CGEventCreateKeyboardEvent(None, _KEYCODE_V, key_down)
+        Quartz.CGEventSetFlags(event, Quartz.kCGEventFlagMaskCommand)
+        Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
+
+
+def _type_unicode(text, chars_per_sec=0.0):
+    """Type text by posting Unicode keyboard events, one event per chunk of characters.
+
+    chars_per_sec > 0 throttles typing by sleeping between chunks.
+    """
+    # An event carries at most 20 UTF-16 units; halve the chunk if surrogate pairs are present
+    step = _UNICODE_CHUNK if max(text) <= "\uffff" else _UNICODE_CHUNK // 2
+    for i in range(0, len(text), step):
+        chunk = text[i:i + step]
+        units = len(chunk.encode("utf-16-le")) // 2
+        for key_down in (True, False):
+            event = Quartz.CGEventCreateKeyboardEvent(None, 0, key_down)
+            Quartz.CGEventKeyboardSetUnicodeString(event, units, chunk)
+            Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
+        if chars_per_sec > 0:
+            time.sleep(len(chunk) / chars_per_sec)
+
+
+def _peak_rms(audio):
+    """Return (peak, RMS) of a 1-D float array without allocating temporaries."""
+    peak = max(float(audio.max()), -float(audio.min()))
+    rms = float(np.sqrt(np.dot(audio, audio) / audio.size))
+    return peak, rms
+
+
+def _resolve_backend(backend):
+    """Pick the transcription backend; 'auto' prefers MLX (Metal) on Apple Silicon when installed."""
+    if backend != "auto":
+        return backend
+    if (sys.platform == "darwin" and platform.machine() == "arm64"
+            and importlib.util.find_spec("mlx_whisper") is not None):
+        return "mlx"
+    return "faster-whisper"
+
+
+def _local_model_path(model_size):
+    """Return a local directory holding the CTranslate2 model, downloading it on first use.
+    
+    Loading from a plain directory skips the Hugging Face Hub lookup WhisperModel
+    does for a size name on every launch. Falls back to the size name on failure.
+    """
+    model_dir = MODEL_CACHE_DIR / model_size
+    if (model_dir / "model.bin").exists():
+        return str(model_dir)
+    try:
+        print(f"📥 Caching Whisper model '{model_size}' in {model_dir}...")
+        return download_model(model_size, output_dir=str(model_dir))
+    except Exception as e:
+        print(f"⚠️  Could not cache model locally: {e}")
+        return model_size
+
+
+def _physical_cpu_count():
+    """Return the number of physical CPU cores (GEMM kernels gain nothing from SMT siblings)."""
+    if sys.platform == "darwin":
+        try:
+            out = subprocess.run(["sysctl", "-n", "hw.physicalcpu"],
+                                 capture_output=True, text=True, check=True)
+            return int(out.stdout.strip())
+        except Exception:
+            pass
+    return os.cpu_count() or 0
+
+
+_SPECIAL_KEYS = {
+    'space': keyboard.Key.space,
+    'enter': keyboard.Key.enter,
+    'esc': keyboard.Key.esc,
+    'tab': keyboard.Key.tab,
+    'ctrl': keyboard.Key.ctrl,
+    'control': keyboard.Key.ctrl,
+    'cmd': keyboard.Key.cmd,
+    'command': keyboard.Key.cmd,
+    'alt': keyboard.Key.alt,
+    'option': keyboard.Key.alt,
+    'shift': keyboard.Key.shift,
+}
+
+
+def _resolve_key(target):
+    """Map a key name ('ctrl', 'space', 'q', 'f1', ...) to a pynput Key, or to the characters it types."""
+    target = target.lower().strip()
+    if target in _SPECIAL_KEYS:
+        return _SPECIAL_KEYS[target]
+    named = getattr(keyboard.Key, target, None)
+    if isinstance(named, keyboard.Key):
+        return named
+    return frozenset({target, target.upper()})
+
+
+@dataclass(frozen=True)
+class VTConfig:
+    """Text delivery settings applied to a VoiceType in one step."""
+    send_to_active: Optional[str] = None
+    type_chars_per_sec: float = 0.0
+    send_delay: float = 0.0
 
 
 class VoiceType:
     """Voice-to-text input tool with push-to-talk."""
     
     def __init__(self, model_size="base", sample_rate=None, device=None, 
-                 save_audio_dir=None, save_transcription_dir=None):
+                 save_audio_dir=None, save_transcription_dir=None, backend="auto",
+                 load_qos=None, compute_type="auto", cfg=None, inference_qos=None):
         self.model_size = model_size
+        self.compute_type = compute_type
+        self.load_qos = load_qos
+        # QoS class for the threads that run inference (macOS only; None keeps the default)
+        self.inference_qos = inference_qos
+        self.backend = _resolve_backend(backend)
         self.sample_rate = sample_rate
         self.device = device
         self.save_audio_dir = Path(save_audio_dir) if save_audio_dir else None
@@ -116,44 +274,165 @@ class VoiceType:
         
         # Recording state
         self.is_recording = False
-        self.recording_thread = None
         self.audio_data = None
         self.recording_sample_rate = None
-        self.stop_recording_flag = False
+        self._audio_buf = np.empty(0, dtype=np.int16)
+        self._write_idx = 0
+        
+        # Persistent input stream; the callback only captures while this is set
+        self._stream = None
+        self._stream_device_name = None
+        self._capture_enabled = threading.Event()
+        
+        # Audio device lookup cache (PortAudio enumeration is slow on CoreAudio)
+        self._devices_cache = None
+        self._macbook_mic_cache = None
         
         # Push-to-talk settings
-        self.last_toggle_time = 0.0
+        # Earliest time.monotonic_ns() at which a key press may start a new recording
+        self.next_toggle_ns = 0
         self.toggle_cooldown = 0.3
         self.toggle_in_progress = False
         self.min_record_seconds = 1.2
         self.record_started_at = 0.0
         self.active_key_down_time = 0.0
         self.press_to_talk_key_pressed = False
+        self.should_exit = False
         self.stop_requested = False
         self.post_roll_seconds = 0.35
+        self._finalize_timer = None
+        self._stop_cond = threading.Condition()
+        self._closed = False
         
         # Transcription settings
         self.language_hint = None
+        self.silence_rms_threshold = 0.01
+        self.silence_peak_threshold = 0.02
         
-        # Text delivery settings
-        self.send_to_active = None
-        self.type_chars_per_sec = 30.0
-        self.send_delay = 0.0
+        # Text delivery settings (send_to_active, type_chars_per_sec, send_delay)
+        self.apply_config(cfg or VTConfig())
         
-        # Load Whisper model
-        print(f"Loading Whisper model '{model_size}'...")
-        self.model = whisper.load_model(model_size)
-        print("✅ Model loaded! Ready to record.")
+        # Load Whisper model in the background so recording can start right away
+        self.model = None
+        self.model_error = None
+        self._model_ready = threading.Event()
+        threading.Thread(target=self._load_model_async, args=(model_size,), daemon=True).start()
         
         # Create save directories if specified
         if self.save_audio_dir:
             self.save_audio_dir.mkdir(parents=True, exist_ok=True)
         if self.save_transcription_dir:
             self.save_transcription_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Worker threads for I/O that should stay off the transcription path
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        
+        # Long-lived AppleScript interpreter for the osascript delivery fallbacks
+        self._osa = None
+        self._osa_lines = queue.SimpleQueue()
+        self._osa_lock = threading.Lock()
+        self._start_osa()
+        
+        # Open the microphone once so a key press only has to flip a flag
+        try:
+            self._open_stream()
+        except Exception as e:
+            print(f"⚠️  Could not open audio input: {e}")
+        atexit.register(self.close)
+        
+        # Finishes recordings when a stop is requested (woken via _stop_cond, no polling)
+        threading.Thread(target=self._stop_worker, daemon=True).start()
+    
+    def apply_config(self, cfg):
+        """Set all VTConfig fields at once and clear per-session key state."""
+        vars(self).update(asdict(cfg))
+        self.should_exit = False
+        self.press_to_talk_key_pressed = False
+    
+    def _load_model_async(self, model_size):
+        """Load and warm up the Whisper model for the selected backend."""
+        if self.load_qos is not None:
+            set_thread_qos(self.load_qos)
+        try:
+            print(f"Loading Whisper model '{model_size}' ({self.backend})...")
+            if self.backend == "mlx":
+                # mlx-whisper loads (and caches) weights on the first transcribe; warm-up triggers it
+                import mlx_whisper
+                self._mlx_whisper = mlx_whisper
+                self.model = _MLX_MODEL_REPOS[model_size]
+            else:
+                # CTranslate2; "auto" picks int8-quantized weights (int8_float16 on CUDA)
+                compute_type = self.compute_type
+                if compute_type == "auto":
+                    compute_type = "int8_float16" if ctranslate2.get_cuda_device_count() > 0 else "int8"
+                # CTranslate2 spawns its inference worker threads here; they inherit this QoS
+                if self.inference_qos is not None:
+                    set_thread_qos(self.inference_qos)
+                self.model = WhisperModel(_local_model_path(model_size), device="auto",
+                                          compute_type=compute_type,
+                                          cpu_threads=_physical_cpu_count(), num_workers=1)
+            self._warmup()
+            print("✅ Model loaded! Ready to record.")
+        except Exception as e:
+            self.model_error = e
+            print(f"❌ Failed to load Whisper model: {e}")
+        finally:
+            self._model_ready.set()
+    
+    def wait_until_loaded(self, timeout=None):
+        """Block until the background model load finishes; raise its error if it failed."""
+        if not self._model_ready.wait(timeout):
+            raise TimeoutError("Whisper model is still loading")
+        if self.model is None:
+            raise self.model_error or RuntimeError("Whisper model failed to load")
+    
+    def _warmup(self):
+        """Run one transcription on silence so the first real one skips thread-pool and kernel setup."""
+        try:
+            started = time.perf_counter()
+            silence = np.zeros(WHISPER_SAMPLE_RATE, dtype=np.float32)
+            self._run_model(silence, language="en", vad_filter=False)
+            print(f"🔥 Model warmed up in {time.perf_counter() - started:.2f}s")
+        except Exception as e:
+            print(f"⚠️  Model warm-up failed: {e}")
+    
+    def _run_model(self, audio, language=None, vad_filter=True):
+        """Transcribe 16 kHz float32 audio with the active backend; returns (text, language)."""
+        if self.backend == "mlx":
+            kwargs = {"temperature": 0.0, "condition_on_previous_text": False}
+            if language:
+                kwargs["language"] = language
+            result = self._mlx_whisper.transcribe(audio, path_or_hf_repo=self.model, **kwargs)
+            return result.get("text", "").strip(), result.get("language")
+        
+        kwargs = {
+            "beam_size": 1,
+            "temperature": 0.0,
+            "condition_on_previous_text": False,
+            "vad_filter": vad_filter,
+        }
+        if language:
+            kwargs["language"] = language
+        segments, info = self.model.transcribe(audio, **kwargs)
+        # Segments are generated lazily; joining them runs the decoder
+        text = "".join(segment.text for segment in segments).strip()
+        return text, info.language
+    
+    def _query_devices(self):
+        """Return the PortAudio device list, enumerating CoreAudio only once."""
+        if self._devices_cache is None:
+            self._devices_cache = sd.query_devices()
+        return self._devices_cache
     
     def get_macbook_microphone(self):
         """Find and return the MacBook Pro microphone device index."""
-        devices = sd.query_devices()
+        if self._macbook_mic_cache is None:
+            self._macbook_mic_cache = self._find_macbook_microphone()
+        return self._macbook_mic_cache
+    
+    def _find_macbook_microphone(self):
+        """Scan input devices for the built-in microphone, skipping iPhone Continuity mics."""
+        devices = self._query_devices()
         for i, device in enumerate(devices):
             if device['max_input_channels'] > 0:
                 name = device['name'].lower()
@@ -169,94 +448,148 @@ class VoiceType:
                 return default_input, int(default_device['default_samplerate'])
         return None, 16000
     
-    def start_recording(self):
-        """Start recording audio in a separate thread."""
-        if self.is_recording:
-            return
-        if self.toggle_in_progress:
-            return
-        self.toggle_in_progress = True
-        
-        self.is_recording = True
-        self.stop_recording_flag = False
-        self.record_started_at = time.time()
-        
-        # Auto-select MacBook microphone if device not specified
+    def _capture_rate(self, device, native_rate):
+        """Prefer capturing at Whisper's rate so no resampling is needed downstream."""
+        try:
+            sd.check_input_settings(device=device, channels=1, dtype='int16',
+                                    samplerate=WHISPER_SAMPLE_RATE)
+            return WHISPER_SAMPLE_RATE
+        except Exception:
+            return native_rate
+    
+    def _open_stream(self):
+        """Select the input device and start a long-lived callback stream on it."""
         if self.device is None:
             device, device_sample_rate = self.get_macbook_microphone()
             if device is not None:
                 if self.sample_rate is None:
-                    self.sample_rate = device_sample_rate
-                device_info = sd.query_devices(device)
-                print(f"\n🎙️  Recording... (Using: {device_info['name']})")
+                    self.sample_rate = self._capture_rate(device, device_sample_rate)
+                self._stream_device_name = self._query_devices()[device]['name']
             else:
                 if self.sample_rate is None:
                     self.sample_rate = 16000
-                print("\n🎙️  Recording... (Using default device)")
+                self._stream_device_name = None
                 device = sd.default.device[0]
         else:
-            if self.sample_rate is None:
-                device_info = sd.query_devices(self.device)
-                self.sample_rate = int(device_info['default_samplerate'])
             device = self.device
-            device_info = sd.query_devices(device)
-            print(f"\n🎙️  Recording... (Using: {device_info['name']})")
+            device_info = self._query_devices()[device]
+            if self.sample_rate is None:
+                self.sample_rate = self._capture_rate(device, int(device_info['default_samplerate']))
+            self._stream_device_name = device_info['name']
+        
+        # Preallocate the capture buffer so the audio callback never allocates
+        self._audio_buf = np.empty(int(self.sample_rate * RECORD_BUFFER_SECONDS), dtype=np.int16)
+        self._write_idx = 0
+        
+        self._stream = sd.InputStream(samplerate=self.sample_rate,
+                                      channels=1,
+                                      device=device,
+                                      dtype='int16',
+                                      blocksize=int(0.02 * self.sample_rate),
+                                      callback=self._audio_cb)
+        self._stream.start()
+    
+    def suspend(self):
+        """Stop the input stream (releasing the microphone) but keep the model loaded."""
+        self._capture_enabled.clear()
+        if self._stream is not None and self._stream.active:
+            self._stream.stop()
+    
+    def resume(self):
+        """Restart an input stream stopped by suspend()."""
+        if self._stream is not None and not self._stream.active:
+            self._stream.start()
+    
+    def close(self):
+        """Stop the input stream, osascript coprocess and worker pool, and drop the model."""
+        atexit.unregister(self.close)
+        with self._stop_cond:
+            self._closed = True
+            self._stop_cond.notify_all()
+        osa, self._osa = self._osa, None
+        if osa is not None:
+            osa.terminate()
+        self._capture_enabled.clear()
+        stream, self._stream = self._stream, None
+        if stream is not None:
+            try:
+                stream.stop()
+                stream.close()
+            except Exception:
+                pass
+        self._executor.shutdown(wait=False)
+        # Release the weights so an unloaded instance does not keep the model alive
+        self.model = None
+    
+    def start_recording(self):
+        """Start capturing audio from the already-open input stream."""
+        if self.is_recording:
+            return
+        if self.toggle_in_progress:
+            return
+        self.toggle_in_progress = True
         
+        if self._stream is None:
+            try:
+                self._open_stream()
+            except Exception as e:
+                print(f"\n❌ Error opening audio input: {e}")
+                self.toggle_in_progress = False
+                return
+        
+        self.is_recording = True
+        self.record_started_at = time.time()
         self.recording_sample_rate = self.sample_rate
         self.stop_requested = False
+        self._write_idx = 0
+        self._capture_enabled.set()
         
-        # Start recording in a separate thread
-        self.recording_thread = threading.Thread(
-            target=self._record_continuously,
-            args=(device,),
-            daemon=True
-        )
-        self.recording_thread.start()
-        
-        # Start a monitor thread to ensure stop happens when requested
-        self.stop_monitor_thread = threading.Thread(
-            target=self._monitor_stop_request,
-            daemon=True
-        )
-        self.stop_monitor_thread.start()
+        if self._stream_device_name:
+            print(f"\n🎙️  Recording... (Using: {self._stream_device_name})")
+        else:
+            print("\n🎙️  Recording... (Using default device)")
         
-        self.toggle_in_progress = False
+        with self._stop_cond:
+            self.toggle_in_progress = False
+            self._stop_cond.notify_all()
     
-    def _monitor_stop_request(self):
-        """Background thread that monitors stop_requested and ensures recording stops."""
-        while self.is_recording:
-            if self.stop_requested:
-                elapsed = time.time() - self.record_started_at
-                if elapsed >= self.min_record_seconds:
-                    self.stop_recording()
-                    break
-            time.sleep(0.1)
+    def _arm_cooldown(self):
+        """Block new recordings for toggle_cooldown seconds from now."""
+        self.next_toggle_ns = time.monotonic_ns() + int(self.toggle_cooldown * 1e9)
     
-    def _record_continuously(self, device):
-        """Record audio continuously until stop flag is set."""
-        audio_chunks = []
-        frames_per_block = int(0.1 * self.sample_rate)
-        try:
-            with sd.InputStream(samplerate=self.sample_rate,
-                                channels=1,
-                                device=device,
-                                dtype='float32',
-                                blocksize=frames_per_block) as stream:
-                while not self.stop_recording_flag:
-                    block, overflowed = stream.read(frames_per_block)
-                    if not self.stop_recording_flag:
-                        audio_chunks.append(block[:, 0].copy())
-        except Exception as e:
-            print(f"\n❌ Error during recording: {e}")
-            self.is_recording = False
+    def request_stop(self):
+        """Ask for the current recording to stop (e.g. on key release) without blocking the caller."""
+        with self._stop_cond:
+            self.stop_requested = True
+            self._arm_cooldown()
+            self._stop_cond.notify_all()
+    
+    def _stop_worker(self):
+        """Wait for stop requests and finish the recording on this thread."""
+        while True:
+            with self._stop_cond:
+                self._stop_cond.wait_for(
+                    lambda: self._closed or (self.stop_requested and self.is_recording
+                                             and not self.toggle_in_progress))
+                if self._closed:
+                    return
+            self.stop_recording()
+    
+    def _audio_cb(self, indata, frames, time_info, status):
+        """PortAudio callback: append the incoming block to the capture buffer."""
+        if not self._capture_enabled.is_set():
             return
-        if audio_chunks:
-            self.audio_data = np.concatenate(audio_chunks)
-        else:
-            self.audio_data = np.array([], dtype='float32')
+        w = self._write_idx
+        if w + frames > self._audio_buf.size:
+            self._audio_buf = np.resize(self._audio_buf, max(self._audio_buf.size * 2, w + frames))
+        np.copyto(self._audio_buf[w:w + frames], indata[:, 0])
+        self._write_idx = w + frames
     
     def stop_recording(self):
-        """Stop recording and transcribe."""
+        """Stop recording after the post-roll and transcribe (stop worker only).
+        
+        Other threads call request_stop(), or finish_recording() to also wait for the result.
+        """
         if not self.is_recording:
             self.stop_requested = False
             return
@@ -266,70 +599,120 @@ class VoiceType:
         elapsed = time.time() - self.record_started_at
         if elapsed < self.min_record_seconds:
             if self.stop_requested:
-                wait_time = self.min_record_seconds - elapsed
-                if wait_time > 0:
-                    time.sleep(wait_time)
+                with self._stop_cond:
+                    self._stop_cond.wait_for(
+                        lambda: time.time() - self.record_started_at >= self.min_record_seconds,
+                        timeout=self.min_record_seconds - elapsed)
             else:
-                self.stop_requested = True
-                self.last_toggle_time = time.time()
+                self.request_stop()
                 return
         
-        self.stop_requested = False
-        self.toggle_in_progress = True
-        
-        print("\n⏹️  Stopping recording...")
-        time.sleep(self.post_roll_seconds)
-        self.stop_recording_flag = True
+        with self._stop_cond:
+            # Re-check after the wait: only one caller may claim this recording's stop
+            if not self.is_recording or self.toggle_in_progress:
+                return
+            self.stop_requested = False
+            self.toggle_in_progress = True
+            
+            print("\n⏹️  Stopping recording...")
+            # Keep capturing through the post-roll on a timer; toggle_in_progress guards re-entry
+            self._finalize_timer = threading.Timer(self.post_roll_seconds, self._finalize_stop)
+            # Timers inherit daemon from their creator (the stop worker or a listener thread);
+            # stay non-daemon so exiting never kills a transcription mid-flight
+            self._finalize_timer.daemon = False
+            self._finalize_timer.start()
+            self._stop_cond.notify_all()
+    
+    def finish_recording(self):
+        """Stop any active recording via the stop worker and wait until it is transcribed."""
+        if self.is_recording:
+            self.request_stop()
+        with self._stop_cond:
+            self._stop_cond.wait_for(
+                lambda: self._closed or not self.is_recording or self.toggle_in_progress)
+        timer = self._finalize_timer
+        if timer is not None:
+            timer.join()
+    
+    def _finalize_stop(self):
+        """End capture once the post-roll has elapsed, then check levels and transcribe."""
+        # mlx-whisper runs inference on the calling thread (a fresh Timer thread each stop)
+        if self.backend == "mlx" and self.inference_qos is not None:
+            set_thread_qos(self.inference_qos)
+        self._capture_enabled.clear()
         self.is_recording = False
         
-        if self.recording_thread:
-            self.recording_thread.join(timeout=2.0)
-        
-        if self.audio_data is None or len(self.audio_data) == 0:
-            print("⚠️  No audio was recorded!")
-            self.toggle_in_progress = False
-            return
-        
-        # Check audio levels
-        max_level = np.max(np.abs(self.audio_data))
-        rms_level = np.sqrt(np.mean(self.audio_data**2))
-        print(f"Audio levels - Peak: {max_level:.4f}, RMS: {rms_level:.4f}")
-        
-        if max_level < 0.001:
-            print("⚠️  WARNING: No audio detected!")
+        # Whatever happens below, a failed stop must not block every later start_recording
+        try:
+            # Capture is 16-bit PCM (half the bytes of float32); convert once for analysis and Whisper
+            self.audio_data = self._audio_buf[:self._write_idx].astype(np.float32)
+            self.audio_data *= 1.0 / 32768.0
+            
+            if len(self.audio_data) == 0:
+                print("⚠️  No audio was recorded!")
+                return
+            
+            # Check audio levels
+            max_level, rms_level = _peak_rms(self.audio_data)
+            print(f"Audio levels - Peak: {max_level:.4f}, RMS: {rms_level:.4f}")
+            
+            if max_level < 0.001:
+                print("⚠️  WARNING: No audio detected!")
+                return
+            
+            # Energy gate: skip Whisper entirely for accidental presses with no speech
+            if rms_level < self.silence_rms_threshold and max_level < self.silence_peak_threshold:
+                print("🤫 No speech detected, skipping transcription.")
+                return
+            
+            # Save audio if requested
+            if self.save_audio_dir:
+                timestamp = time.strftime("%Y%m%d_%H%M%S")
+                audio_filename = self.save_audio_dir / f"recording_{timestamp}.wav"
+                # Encode here, then leave the disk write to a worker so transcription starts immediately
+                wav = io.BytesIO()
+                sf.write(wav, self.audio_data, self.recording_sample_rate, format='WAV', subtype='PCM_16')
+                self._executor.submit(self._write_audio_file, audio_filename, wav.getvalue())
+            
+            # Transcribe
+            self._transcribe_audio()
+        finally:
             self.toggle_in_progress = False
-            return
-        
-        # Save audio if requested
-        if self.save_audio_dir:
-            timestamp = time.strftime("%Y%m%d_%H%M%S")
-            audio_filename = self.save_audio_dir / f"recording_{timestamp}.wav"
-            sf.write(str(audio_filename), self.audio_data, self.recording_sample_rate)
+    
+    def _write_audio_file(self, audio_filename, data):
+        """Write an encoded WAV recording to disk."""
+        try:
+            audio_filename.write_bytes(data)
             print(f"💾 Audio saved to '{audio_filename}'")
-        
-        # Transcribe
-        self._transcribe_audio()
-        self.toggle_in_progress = False
+        except Exception as e:
+            print(f"⚠️  Failed to save audio: {e}")
     
     def _transcribe_audio(self):
         """Transcribe the recorded audio."""
         print("\n📝 Transcribing...")
         
-        # Save audio to temporary file for Whisper
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp_file:
-            tmp_path = tmp_file.name
-            sf.write(tmp_path, self.audio_data, self.recording_sample_rate)
+        # Whisper consumes 16 kHz mono float32; resample in memory instead of
+        # round-tripping through a WAV file
+        if self.recording_sample_rate != WHISPER_SAMPLE_RATE:
+            audio = resample_poly(self.audio_data, WHISPER_SAMPLE_RATE, self.recording_sample_rate)
+            audio = audio.astype(np.float32, copy=False)
+        else:
+            audio = self.audio_data.astype(np.float32, copy=False)
         
         try:
-            transcribe_kwargs = {
-                "temperature": 0.0,
-                "condition_on_previous_text": False,
-            }
-            if self.language_hint:
-                transcribe_kwargs["language"] = self.language_hint
-            result = self.model.transcribe(tmp_path, **transcribe_kwargs)
+            if not self._model_ready.is_set():
+                print("⏳ Waiting for model...")
+                self._model_ready.wait()
+            if self.model is None:
+                print(f"❌ Whisper model unavailable: {self.model_error}")
+                return
+            
+            # Let the focus/send delay elapse while the model runs instead of after it
+            send_ready = None
+            if self.send_to_active and self.send_delay and self.send_delay > 0:
+                send_ready = self._executor.submit(time.sleep, self.send_delay)
             
-            transcription_text = result.get("text", "").strip()
+            transcription_text, detected_language = self._run_model(audio, language=self.language_hint)
             
             print("\n" + "="*60)
             print("TRANSCRIPTION:")
@@ -340,8 +723,8 @@ class VoiceType:
                 print("(No transcription - audio may be silent or too quiet)")
             print("="*60)
             
-            if "language" in result:
-                print(f"\n🌐 Detected language: {result['language']}")
+            if detected_language:
+                print(f"\n🌐 Detected language: {detected_language}")
             
             # Save transcription if requested
             if self.save_transcription_dir and transcription_text:
@@ -354,37 +737,109 @@ class VoiceType:
             # Send to active app if configured
             if transcription_text and self.send_to_active:
                 print("\n⌨️  Sending transcription to active application...")
-                self._deliver_transcription(transcription_text)
+                self._deliver_transcription(transcription_text, send_ready)
             
+        except Exception as e:
+            print(f"❌ Transcription failed: {e}")
         finally:
-            self.last_toggle_time = time.time()
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+            self._arm_cooldown()
     
-    def _deliver_transcription(self, text: str):
-        """Deliver transcription to the currently focused application."""
+    def _start_osa(self):
+        """Spawn an interactive osascript process and a thread that forwards its output lines."""
         try:
-            if self.send_delay and self.send_delay > 0:
+            self._osa = subprocess.Popen(["osascript", "-i"], stdin=subprocess.PIPE,
+                                         stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                         text=True, bufsize=1)
+        except Exception:
+            self._osa = None
+            return
+        osa, lines = self._osa, self._osa_lines
+        
+        def pump():
+            for line in osa.stdout:
+                lines.put(line)
+        
+        threading.Thread(target=pump, daemon=True).start()
+    
+    def _osa_run(self, script: str, timeout: float = 10.0):
+        """Run a one-line AppleScript in the persistent osascript process.
+        
+        Falls back to a one-off `osascript -e` when the coprocess is unavailable.
+        Raises RuntimeError on script errors and TimeoutError if it does not finish.
+        """
+        with self._osa_lock:
+            osa = self._osa
+            if osa is None or osa.poll() is not None:
+                subprocess.run(["osascript", "-e", script], check=True, timeout=timeout)
+                return
+            # Drop output left over from an earlier timed-out script
+            while not self._osa_lines.empty():
+                self._osa_lines.get_nowait()
+            osa.stdin.write(script.replace("\n", "\\n") + "\n" + f'log "{_OSA_DONE}"\n')
+            osa.stdin.flush()
+            deadline = time.monotonic() + timeout
+            error = None
+            while True:
+                try:
+                    line = self._osa_lines.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    self._osa = None
+                    osa.kill()
+                    self._start_osa()
+                    raise TimeoutError(f"osascript did not finish within {timeout}s")
+                if _OSA_DONE in line:
+                    break
+                if "error" in line.lower():
+                    error = line.strip()
+            if error:
+                raise RuntimeError(error)
+    
+    def _deliver_transcription(self, text: str, send_ready=None):
+        """Deliver transcription to the currently focused application.
+        
+        send_ready is an optional future for a send delay already running in the background.
+        """
+        try:
+            if send_ready is not None:
+                send_ready.result()
+            elif self.send_delay and self.send_delay > 0:
                 time.sleep(self.send_delay)
             
             if self.send_to_active == 'paste':
-                # Use pbcopy to set clipboard, then Cmd+V to paste
-                try:
-                    subprocess.run(["pbcopy"], input=text, text=True, check=True)
-                except Exception as e:
-                    print(f"⚠️  Clipboard set failed: {e}. Trying AppleScript...")
+                # Set the clipboard in-process; fall back to pbcopy / AppleScript
+                clipboard_set = False
+                if NSPasteboard is not None:
                     try:
-                        as_text = text.replace("\\", "\\\\").replace("\"", "\\\"")
-                        script = f'set the clipboard to "{as_text}"'
-                        subprocess.run(["osascript", "-e", script], check=True)
-                    except Exception as e2:
-                        print(f"❌ AppleScript clipboard set failed: {e2}")
+                        _set_clipboard(text)
+                        clipboard_set = True
+                    except Exception as e:
+                        print(f"⚠️  Pasteboard set failed: {e}. Trying pbcopy...")
+                if not clipboard_set:
+                    try:
+                        subprocess.run(["pbcopy"], input=text, text=True, check=True)
+                    except Exception as e:
+                        print(f"⚠️  Clipboard set failed: {e}. Trying AppleScript...")
+                        try:
+                            as_text = text.replace("\\", "\\\\").replace("\"", "\\\"")
+                            script = f'set the clipboard to "{as_text}"'
+                            self._osa_run(script)
+                        except Exception as e2:
+                            print(f"❌ AppleScript clipboard set failed: {e2}")
+                            return
+                
+                # Post Cmd+V straight to the HID event stream (no subprocess)
+                if Quartz is not None:
+                    try:
+                        _post_cmd_v()
+                        print("✅ Pasted into active app.")
                         return
+                    except Exception as e:
+                        print(f"⚠️  Quartz paste failed: {e}. Trying AppleScript...")
                 
-                # Try Cmd+V via AppleScript first (more reliable)
+                # Cmd+V via AppleScript, then pynput
                 try:
                     script = 'tell application "System Events" to keystroke "v" using command down'
-                    subprocess.run(["osascript", "-e", script], check=True, timeout=5)
+                    self._osa_run(script, timeout=5)
                     print("✅ Pasted into active app (AppleScript).")
                 except Exception as e:
                     print(f"⚠️  AppleScript paste failed: {e}. Trying pynput...")
@@ -399,21 +854,27 @@ class VoiceType:
                         print(f"❌ Cmd+V paste via pynput also failed: {e2}")
             
             elif self.send_to_active == 'type':
-                # Use AppleScript first (more reliable in menu bar apps)
+                # Post the text as Unicode keyboard events (no subprocess, no per-char loop)
+                if Quartz is not None:
+                    try:
+                        _type_unicode(text, self.type_chars_per_sec)
+                        print("✅ Typed into active app.")
+                        return
+                    except Exception as e:
+                        print(f"⚠️  Quartz typing failed: {e}. Trying AppleScript...")
+                
+                # AppleScript, then pynput
                 try:
                     # Escape special characters for AppleScript
                     as_text = text.replace("\\", "\\\\").replace("\"", "\\\"").replace("$", "\\$")
                     script = f'tell application "System Events" to keystroke "{as_text}"'
-                    subprocess.run(["osascript", "-e", script], check=True, timeout=30)
+                    self._osa_run(script, timeout=30)
                     print("✅ Typed into active app (AppleScript).")
                 except Exception as e:
                     print(f"⚠️  AppleScript typing failed: {e}. Trying pynput...")
                     try:
                         kb = Controller()
-                        delay = 1.0 / max(self.type_chars_per_sec, 1.0)
-                        for ch in text:
-                            kb.type(ch)
-                            time.sleep(delay)
+                        kb.type(text)
                         print("✅ Typed into active app.")
                     except Exception as e2:
                         print(f"❌ Typing via pynput also failed: {e2}")
@@ -432,65 +893,37 @@ class VoiceType:
         self.should_exit = False
         self.press_to_talk_key_pressed = False
         
-        def key_matches_target(key_obj, target: str) -> bool:
-            """Improved key matching that handles modifier key variants."""
-            target = target.lower().strip()
-            
-            special_map = {
-                'space': keyboard.Key.space,
-                'enter': keyboard.Key.enter,
-                'esc': keyboard.Key.esc,
-                'tab': keyboard.Key.tab,
-            }
-            if target in special_map:
-                return key_obj == special_map[target]
-            
-            modifier_map = {
-                'ctrl': keyboard.Key.ctrl,
-                'control': keyboard.Key.ctrl,
-                'cmd': keyboard.Key.cmd,
-                'command': keyboard.Key.cmd,
-                'alt': keyboard.Key.alt,
-                'option': keyboard.Key.alt,
-                'shift': keyboard.Key.shift,
-            }
-            if target in modifier_map:
-                return key_obj == modifier_map[target]
-            
-            # Regular character key
-            try:
-                if hasattr(key_obj, 'char') and key_obj.char:
-                    return key_obj.char.lower() == target.lower()
-                if hasattr(key_obj, 'name'):
-                    return key_obj.name.lower() == target.lower()
-            except Exception:
-                pass
-            
-            return False
+        # Resolve the target once; the per-event check is a single comparison
+        resolved = _resolve_key(target_key)
+        ESC = keyboard.Key.esc
+        if isinstance(resolved, frozenset):
+            def key_matches_target(key_obj) -> bool:
+                return getattr(key_obj, 'char', None) in resolved
+        else:
+            def key_matches_target(key_obj) -> bool:
+                return key_obj == resolved
         
         def on_key_press(key):
             try:
-                if key_matches_target(key, 'esc'):
+                if key is ESC:
                     if self.is_recording:
                         print("\n⚠️  Stopping current recording before exit...")
-                        self.stop_recording()
+                        self.request_stop()
                     print("\n👋 Exiting...")
                     self.should_exit = True
                     return False
                 
-                if key_matches_target(key, target_key):
+                if key_matches_target(key):
                     if self.press_to_talk_key_pressed:
                         return
                     if self.is_recording:
                         return
                     
-                    now = time.time()
-                    time_since_last = now - self.last_toggle_time
-                    if time_since_last < self.toggle_cooldown:
+                    if time.monotonic_ns() < self.next_toggle_ns:
                         return
                     
                     self.press_to_talk_key_pressed = True
-                    self.active_key_down_time = now
+                    self.active_key_down_time = time.time()
                     self.start_recording()
             except Exception as e:
                 print(f"⚠️  Error in key press handler: {e}")
@@ -498,7 +931,7 @@ class VoiceType:
         
         def on_key_release(key):
             try:
-                if key_matches_target(key, target_key):
+                if key_matches_target(key):
                     if not self.press_to_talk_key_pressed:
                         return
                     if not self.is_recording:
@@ -506,8 +939,7 @@ class VoiceType:
                         return
                     
                     self.press_to_talk_key_pressed = False
-                    self.stop_requested = True
-                    self.last_toggle_time = time.time()
+                    self.request_stop()
             except Exception as e:
                 print(f"⚠️  Error in key release handler: {e}")
         
@@ -526,11 +958,16 @@ class VoiceType:
             print("\n👋 Exiting...")
         finally:
             listener.stop()
-            if self.is_recording:
-                self.stop_recording()
+            # Let a pending post-roll and transcription finish before returning to main()
+            self.finish_recording()
 
 
 def main():
+    # Lock cleanup is registered here, not at import, so the menu bar app can
+    # import this module from a worker thread
+    atexit.register(_release_lock)
+    signal.signal(signal.SIGTERM, _signal_handler)
+    
     # Check for existing instance
     if not _acquire_lock():
         print("⚠️  Another instance of VoiceType is already running.")
@@ -552,13 +989,19 @@ def main():
         help="Enable press-to-talk using this key (hold to record, release to stop). Examples: 'ctrl', 'space', 'q'")
     parser.add_argument("--send-to-active", type=str, choices=["paste", "type"], default="paste",
         help="How to send transcription into the currently focused app: 'paste' (default) or 'type'")
-    parser.add_argument("--type-chars-per-sec", type=float, default=30.0,
-        help="Typing speed when using --send-to-active type (default: 30 chars/sec)")
+    parser.add_argument("--type-chars-per-sec", type=float, default=0.0,
+        help="Throttle typing speed when using --send-to-active type (default: 0, type as fast as possible)")
     parser.add_argument("--send-delay", type=float, default=0.2,
         help="Delay (seconds) before sending text to allow focus on target field (default: 0.2)")
     parser.add_argument("--model", type=str, default="base",
         choices=["tiny", "base", "small", "medium", "large"],
         help="Whisper model size (default: base)")
+    parser.add_argument("--backend", type=str, default="auto",
+        choices=["auto", "faster-whisper", "mlx"],
+        help="Transcription backend (default: auto - mlx on Apple Silicon if installed, else faster-whisper)")
+    parser.add_argument("--compute-type", type=str, default="auto",
+        choices=["auto", "int8", "float32"],
+        help="faster-whisper weight precision (default: auto - int8, int8_float16 on CUDA)")
     parser.add_argument("--sample-rate", type=int, default=None,
         help="Audio sample rate in Hz (default: auto-detect from device)")
     parser.add_argument("--device", type=int, default=None,
@@ -581,13 +1024,26 @@ def main():
                 print(f"  [{i}] {device['name']}{default}")
         sys.exit(0)
     
+    # An explicit precision only means something to faster-whisper
+    backend = args.backend
+    if args.compute_type != "auto":
+        if backend == "auto":
+            backend = "faster-whisper"
+        elif backend == "mlx":
+            print(f"⚠️  --compute-type {args.compute_type} has no effect with the MLX backend")
+    
     # Create VoiceType instance
     voicetype = VoiceType(
         model_size=args.model,
         sample_rate=args.sample_rate,
         device=args.device,
         save_audio_dir=args.save_audio_dir,
-        save_transcription_dir=args.save_transcription_dir
+        save_transcription_dir=args.save_transcription_dir,
+        backend=backend,
+        compute_type=args.compute_type,
+        cfg=VTConfig(send_to_active=args.send_to_active,
+                     type_chars_per_sec=args.type_chars_per_sec,
+                     send_delay=args.send_delay)
     )
     
     # Configure settings
@@ -595,9 +1051,6 @@ def main():
     voicetype.min_record_seconds = args.min_record_seconds
     voicetype.post_roll_seconds = args.post_roll_seconds
     voicetype.language_hint = args.language
-    voicetype.send_to_active = args.send_to_active
-    voicetype.type_chars_per_sec = args.type_chars_per_sec
-    voicetype.send_delay = args.send_delay
     
     # Run press-to-talk
     voicetype.run_press_to_talk(args.press_to_talk)
@@ -9,7 +9,7 @@ import sys
 if sys.version_info < (3, 10) or sys.version_info >= (3, 14):
     print(f"❌ Error: VoiceType requires Python >=3.10, <3.14")
     print(f"   Current version: {sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}")
-    print(f"\n   Note: Python 3.14 is not yet supported due to numba dependency limitations.")
+    print(f"\n   Note: Python 3.14 is not yet supported by all of VoiceType's dependencies.")
     print(f"\n   Please install a compatible Python version:")
     print(f"   - Python 3.10, 3.11, 3.12, or 3.13")
     print(f"   - Using pyenv: pyenv install 3.13")
@@ -18,21 +18,32 @@ if sys.version_info < (3, 10) or sys.version_info >= (3, 14):
 
 import threading
 import time
+import traceback
 import os
+import fcntl
+import json
+import collections
+import ctypes
+import atexit
+import signal
+from enum import IntEnum
 from pathlib import Path
 from AppKit import (
-    NSApplication, NSStatusBar, NSStatusItem, NSVariableStatusItemLength,
+    NSApplication, NSStatusBar, NSVariableStatusItemLength,
     NSMenu, NSMenuItem, NSApplicationActivationPolicyAccessory, NSApp,
-    NSEvent, NSKeyDownMask, NSKeyUpMask, NSFlagsChangedMask, NSAlert, NSInformationalAlertStyle,
-    NSWindow, NSTextField, NSButton, NSPopUpButton, NSStackView, NSScreen, NSMakeRect, NSMakeSize,
+    NSAlert, NSInformationalAlertStyle, NSImage,
+    NSWindow, NSTextField, NSButton, NSPopUpButton, NSStackView, NSScreen, NSMakeRect,
     NSEdgeInsetsMake
 )
-from Foundation import NSObject
+from Foundation import NSObject, NSOperationQueue, NSQualityOfServiceUserInitiated
+import Quartz
 from PyObjCTools import AppHelper
 import objc
 
-# Import VoiceType at module level so signal handlers are registered in main thread
-from voicetype import VoiceType
+# VoiceType itself (and its numeric stack) is imported lazily on the model-loading thread
+from voicetype_qos import (
+    set_thread_qos, QOS_CLASS_USER_INTERACTIVE, QOS_CLASS_USER_INITIATED, QOS_CLASS_BACKGROUND
+)
 
 # Lock file for single-instance enforcement
 APP_LOCK_FILE = Path.home() / ".voicetype_app.lock"
@@ -43,31 +54,90 @@ APP_CONFIG_FILE = Path.home() / ".voicetype_app_config.json"
 
 # Default configuration
 DEFAULT_APP_CONFIG = {
-    "press_to_talk_key": "ctrl"
+    "press_to_talk_key": "ctrl",
+    "compute_type": "int8"
+}
+
+class PTTKey(IntEnum):
+    """Supported press-to-talk keys; each value is the key's modifier flag bit."""
+    CTRL = Quartz.kCGEventFlagMaskControl
+    CMD = Quartz.kCGEventFlagMaskCommand
+    ALT = Quartz.kCGEventFlagMaskAlternate
+    SHIFT = Quartz.kCGEventFlagMaskShift
+    
+    @property
+    def label(self):
+        """Canonical name shown in the UI and stored in the config file."""
+        return self.name.lower()
+
+
+# Press-to-talk key for each accepted spelling
+_KEY_NORMALIZE = {
+    "ctrl": PTTKey.CTRL,
+    "control": PTTKey.CTRL,
+    "cmd": PTTKey.CMD,
+    "command": PTTKey.CMD,
+    "alt": PTTKey.ALT,
+    "option": PTTKey.ALT,
+    "shift": PTTKey.SHIFT,
+}
+
+
+def _to_ptt_key(value):
+    """Resolve a config value (name or PTTKey) to a PTTKey, defaulting to ctrl."""
+    if isinstance(value, PTTKey):
+        return value
+    return _KEY_NORMALIZE.get(str(value).lower(), PTTKey.CTRL)
+
+# Status bar icon per state: (SF Symbol name, emoji fallback for macOS < 11)
+_STATUS_ICONS = {
+    "idle": ("mic.fill", "🎤"),
+    "loading": ("hourglass", "⏳"),
+    "live": ("record.circle.fill", "🟢"),
+    "warning": ("exclamationmark.triangle.fill", "⚠️"),
 }
 
+# Press-to-talk edges closer together than this are treated as key bounce
+_DEBOUNCE_NS = 5_000_000
+
+# Parsed configuration; only save_app_config changes the file, so it is read once
+_app_config_cache = None
+
 
 def load_app_config():
-    """Load app configuration from file."""
+    """Load app configuration, reading the file only on first use."""
+    global _app_config_cache
+    if _app_config_cache is not None:
+        return _app_config_cache.copy()
+    
+    result = DEFAULT_APP_CONFIG.copy()
     if APP_CONFIG_FILE.exists():
         try:
-            import json
             with open(APP_CONFIG_FILE, 'r') as f:
-                config = json.load(f)
-                result = DEFAULT_APP_CONFIG.copy()
-                result.update(config)
-                return result
+                result.update(json.load(f))
         except Exception as e:
             print(f"Error loading config: {e}")
-    return DEFAULT_APP_CONFIG.copy()
+    result["press_to_talk_key"] = _to_ptt_key(result["press_to_talk_key"])
+    _app_config_cache = result
+    return result.copy()
 
 
 def save_app_config(config):
-    """Save app configuration to file."""
+    """Save app configuration to file atomically."""
+    global _app_config_cache
+    # Write a sibling temp file and rename it over the target so a crash
+    # mid-write never leaves truncated JSON behind
+    tmp = APP_CONFIG_FILE.with_suffix('.json.tmp')
     try:
-        import json
-        with open(APP_CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=2)
+        config = dict(config)
+        config["press_to_talk_key"] = _to_ptt_key(config.get("press_to_talk_key"))
+        on_disk = dict(config, press_to_talk_key=config["press_to_talk_key"].label)
+        with open(tmp, 'w') as f:
+            f.write(json.dumps(on_disk, indent=2))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, APP_CONFIG_FILE)
+        _app_config_cache = dict(config)
         return True
     except Exception as e:
         print(f"Error saving config: {e}")
@@ -75,56 +145,74 @@ def save_app_config(config):
 
 
 def _acquire_app_lock():
-    """Acquire a lock file to prevent multiple instances from running."""
+    """Acquire an exclusive flock on the lock file to prevent multiple instances from running.
+    
+    The kernel drops the lock when the process exits, so a crash never leaves a stale lock.
+    """
     global _app_lock_file_handle
     
-    if APP_LOCK_FILE.exists():
-        try:
-            with open(APP_LOCK_FILE, 'r') as f:
-                pid_str = f.read().strip()
-                try:
-                    old_pid = int(pid_str)
-                    # Check if process is still running
-                    os.kill(old_pid, 0)
-                    return False  # Another instance is running
-                except (ValueError, OSError):
-                    # Process doesn't exist, remove stale lock file
-                    try:
-                        APP_LOCK_FILE.unlink()
-                    except Exception:
-                        pass
-        except Exception:
-            try:
-                APP_LOCK_FILE.unlink()
-            except Exception:
-                pass
+    try:
+        fd = os.open(APP_LOCK_FILE, os.O_RDWR | os.O_CREAT, 0o644)
+    except OSError as e:
+        print(f"⚠️  Failed to open lock file: {e}")
+        return False
     
     try:
-        _app_lock_file_handle = open(APP_LOCK_FILE, 'w')
-        _app_lock_file_handle.write(str(os.getpid()))
-        _app_lock_file_handle.flush()
-        return True
-    except Exception as e:
-        print(f"⚠️  Failed to create lock file: {e}")
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        os.close(fd)
+        return False  # Another instance is running
+    except OSError as e:
+        os.close(fd)
+        print(f"⚠️  Failed to lock {APP_LOCK_FILE}: {e}")
         return False
+    
+    # Record our PID for humans; the lock itself is what enforces single-instance
+    os.ftruncate(fd, 0)
+    os.write(fd, str(os.getpid()).encode())
+    _app_lock_file_handle = fd
+    return True
 
 
 def _release_app_lock():
-    """Release the lock file."""
+    """Release the lock file (left in place; unlinking it would reopen the race)."""
     global _app_lock_file_handle
     
-    if _app_lock_file_handle:
+    if _app_lock_file_handle is not None:
         try:
-            _app_lock_file_handle.close()
-        except Exception:
+            fcntl.flock(_app_lock_file_handle, fcntl.LOCK_UN)
+            os.close(_app_lock_file_handle)
+        except OSError:
             pass
         _app_lock_file_handle = None
+
+
+atexit.register(_release_app_lock)
+
+
+# IOHIDRequestType / IOHIDAccessType values (<IOKit/hidsystem/IOHIDLib.h>)
+_kIOHIDRequestTypeListenEvent = 1
+_kIOHIDAccessTypeGranted = 0
+
+
+def _input_monitoring_granted():
+    """Return True if the app may listen to keyboard events (Input Monitoring).
     
-    if APP_LOCK_FILE.exists():
-        try:
-            APP_LOCK_FILE.unlink()
-        except Exception:
-            pass
+    Asks the system to prompt the user when access has not been granted yet.
+    """
+    try:
+        iokit = ctypes.cdll.LoadLibrary("/System/Library/Frameworks/IOKit.framework/IOKit")
+        iokit.IOHIDCheckAccess.argtypes = [ctypes.c_uint32]
+        iokit.IOHIDCheckAccess.restype = ctypes.c_uint32
+        if iokit.IOHIDCheckAccess(_kIOHIDRequestTypeListenEvent) == _kIOHIDAccessTypeGranted:
+            return True
+        iokit.IOHIDRequestAccess.argtypes = [ctypes.c_uint32]
+        iokit.IOHIDRequestAccess.restype = ctypes.c_bool
+        return bool(iokit.IOHIDRequestAccess(_kIOHIDRequestTypeListenEvent))
+    except (OSError, AttributeError):
+        if Quartz.CGPreflightListenEventAccess():
+            return True
+        return bool(Quartz.CGRequestListenEventAccess())
 
 
 class VoiceTypeApp(NSObject):
@@ -135,17 +223,41 @@ class VoiceTypeApp(NSObject):
         if self is None:
             return None
         
-        # VoiceType instance
+        # VoiceType instance and the delivery settings it runs with
         self.voicetype = None
+        self._vt_cfg = None
+        # Bumped by every start/unload; a load whose generation is stale discards its instance
+        self._load_generation = 0
+        self._load_lock = threading.Lock()
         self.is_running = False
         self.keyboard_thread = None
+        self._error_logged = False
+        # Per-keypress logging costs a stdout flush on the event path; opt in with VOICETYPE_VERBOSE=1
+        self._verbose = os.environ.get("VOICETYPE_VERBOSE") == "1"
+        # Event-path messages go into a bounded ring; a background thread writes them out
+        self._log = collections.deque(maxlen=256)
+        self._log_pending = threading.Event()
+        threading.Thread(target=self._drain_log, daemon=True).start()
+        
+        # Keyboard monitoring state (always defined so teardown needs no hasattr);
+        # event_monitor holds the (tap, run loop source) pair while monitoring
+        self.event_monitor = None
+        self._tap_run_loop = None
+        self._ptt_mask = int(PTTKey.CTRL)
+        self._edge_handlers = (self._on_key_up, self._on_key_down)
+        self._tap_callback = None
+        
+        # Model loads run at user-initiated QoS so the scheduler favours performance cores
+        self._load_queue = NSOperationQueue.alloc().init()
+        self._load_queue.setQualityOfService_(NSQualityOfServiceUserInitiated)
+        self._load_queue.setMaxConcurrentOperationCount_(1)
         
         # Settings window reference
         self.settings_window = None
         
         # Load configuration
         self.config = load_app_config()
-        self.press_to_talk_key = self.config.get("press_to_talk_key", "ctrl")
+        self.press_to_talk_key = self.config["press_to_talk_key"]
         
         # Create status bar item
         try:
@@ -153,7 +265,8 @@ class VoiceTypeApp(NSObject):
             self.status_item = self.status_bar.statusItemWithLength_(NSVariableStatusItemLength)
             if self.status_item:
                 self.status_item.retain()
-                self.status_item.setTitle_("🎤")
+                self._status_images = self._load_status_images()
+                self._set_status("idle")
                 self.status_item.setHighlightMode_(True)
             else:
                 print("Failed to create status item")
@@ -173,23 +286,55 @@ class VoiceTypeApp(NSObject):
         
         return self
     
-    def build_menu(self):
-        """Build the menu."""
-        self.menu.removeAllItems()
-        
-        if self.is_running:
-            stop_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
-                "Stop", "stopVoicetype:", ""
-            )
-            self.menu.addItem_(stop_item)
+    @objc.python_method
+    def _load_status_images(self):
+        """Render each status icon once as a template image (empty dict if SF Symbols are unavailable)."""
+        images = {}
+        if not hasattr(NSImage, "imageWithSystemSymbolName_accessibilityDescription_"):
+            return images
+        for state, (symbol, _) in _STATUS_ICONS.items():
+            image = NSImage.imageWithSystemSymbolName_accessibilityDescription_(symbol, f"VoiceType {state}")
+            if image is not None:
+                image.setTemplate_(True)
+                images[state] = image
+        return images
+    
+    @objc.python_method
+    def _set_status(self, state):
+        """Show the icon for state ("idle", "loading", "live" or "warning") in the menu bar."""
+        image = self._status_images.get(state)
+        if image is not None:
+            self.status_item.button().setImage_(image)
         else:
-            start_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
-                "Start", "startVoicetype:", ""
-            )
-            self.menu.addItem_(start_item)
+            self.status_item.setTitle_(_STATUS_ICONS[state][1])
+    
+    def build_menu(self):
+        """Build the menu once; later state changes only touch the Start/Stop item."""
+        # Start and Stop both live in the menu; state changes only flip which is hidden
+        self.start_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
+            "Start", "startVoicetype:", ""
+        )
+        self.menu.addItem_(self.start_item)
+        self.stop_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
+            "Stop", "stopVoicetype:", ""
+        )
+        self.menu.addItem_(self.stop_item)
+        self._menu_running = None
         
         self.menu.addItem_(NSMenuItem.separatorItem())
         
+        # Model precision; int8 is faster on most CPUs, float32 is the fallback
+        self.int8_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
+            "Quantized Model (int8)", "toggleComputeType:", ""
+        )
+        self.int8_item.setState_(1 if self.config["compute_type"] == "int8" else 0)
+        self.menu.addItem_(self.int8_item)
+        
+        unload_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
+            "Unload Model", "unloadModel:", ""
+        )
+        self.menu.addItem_(unload_item)
+        
         # Settings
         settings_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
             "Settings...", "showSettings:", ""
@@ -201,7 +346,19 @@ class VoiceTypeApp(NSObject):
         quit_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
             "Quit", "terminate:", "q"
         )
+        # NSApplication implements terminate: itself; target the delegate so unload/cleanup runs
+        quit_item.setTarget_(self)
         self.menu.addItem_(quit_item)
+        
+        self._update_toggle_item()
+    
+    def _update_toggle_item(self):
+        """Show whichever of Start/Stop matches the running state; no-op if it already does."""
+        if self._menu_running == self.is_running:
+            return
+        self._menu_running = self.is_running
+        self.start_item.setHidden_(self.is_running)
+        self.stop_item.setHidden_(not self.is_running)
     
     def startVoicetype_(self, sender):
         """Start VoiceType."""
@@ -209,148 +366,282 @@ class VoiceTypeApp(NSObject):
             return
         
         self.is_running = True
-        self.status_item.setTitle_("⏳")
-        self.build_menu()
+        
+        # A model kept from the last session only needs its microphone stream back
+        if self.voicetype is not None:
+            self.voicetype.apply_config(self._vt_cfg)
+            self.voicetype.resume()
+            self.modelLoaded()
+            return
+        
+        self._set_status("loading")
+        self._update_toggle_item()
+        
+        with self._load_lock:
+            self._load_generation += 1
+            generation = self._load_generation
         
         # Load model in background
         def load_model():
             try:
-                # VoiceType is already imported at module level (signal handlers registered in main thread)
+                # Deferred so numpy/CTranslate2 load here rather than before the menu bar icon appears
+                from voicetype import VoiceType, VTConfig
+                # Typing mode, delivered as fast as the target app accepts it
+                self._vt_cfg = VTConfig(send_to_active="type", type_chars_per_sec=0.0, send_delay=0.2)
                 print("Loading Whisper model...")
-                self.voicetype = VoiceType(model_size="base")
+                # Pin faster-whisper: "auto" picks fp16 MLX on Apple Silicon, which would make
+                # the int8/float32 menu toggle meaningless
+                vt = VoiceType(model_size="base", backend="faster-whisper",
+                               load_qos=QOS_CLASS_USER_INITIATED,
+                               compute_type=self.config["compute_type"], cfg=self._vt_cfg,
+                               inference_qos=QOS_CLASS_USER_INTERACTIVE)
                 
-                # Configure for typing mode
-                self.voicetype.send_to_active = "type"
-                self.voicetype.type_chars_per_sec = 30.0
-                self.voicetype.send_delay = 0.2
-                self.voicetype.should_exit = False
+                # The event tap needs Input Monitoring; check it here, off the main thread,
+                # while the weights load
+                monitoring_granted = _input_monitoring_granted()
+                
+                # The constructor only starts the load; wait for the weights (and warm-up)
+                try:
+                    vt.wait_until_loaded()
+                except Exception:
+                    vt.close()
+                    if generation != self._load_generation:
+                        return
+                    raise
+                
+                # A later start or an unload superseded this load; don't leak its microphone and model
+                with self._load_lock:
+                    current = generation == self._load_generation
+                    if current:
+                        self.voicetype = vt
+                if not current:
+                    vt.close()
+                    print("Discarding superseded model load")
+                    return
                 
                 print("Model loaded, starting keyboard listener...")
-                AppHelper.callAfter(self._model_loaded)
+                self.performSelectorOnMainThread_withObject_waitUntilDone_("modelLoaded", None, False)
+                if not monitoring_granted:
+                    print("Input Monitoring permission not granted")
+                    self.performSelectorOnMainThread_withObject_waitUntilDone_(
+                        "inputMonitoringDenied", None, False)
             except Exception as e:
                 print(f"Error: {e}")
-                import traceback
                 traceback.print_exc()
-                AppHelper.callAfter(self._model_load_error, str(e))
+                self.performSelectorOnMainThread_withObject_waitUntilDone_("modelLoadError:", str(e), False)
         
-        thread = threading.Thread(target=load_model, daemon=True)
-        thread.start()
+        self._load_queue.addOperationWithBlock_(load_model)
     
-    def _model_loaded(self):
-        """Called when model is loaded."""
+    def modelLoaded(self):
+        """Called on the main thread (via performSelectorOnMainThread) when the model is loaded."""
         try:
             if not self.is_running:
+                # Stopped while loading; keep the model but release the microphone
+                if self.voicetype is not None:
+                    self.voicetype.suspend()
                 return
             
-            self.status_item.setTitle_("🟢")
-            
-            # Import pynput in main thread first to avoid trace trap
-            try:
-                from pynput import keyboard
-                # Test that we can create a listener (this might fail if permissions aren't granted)
-                test_listener = keyboard.Listener(on_press=lambda k: None, on_release=lambda k: None)
-                test_listener.stop()  # Clean up test listener
-                print("pynput initialized successfully")
-            except Exception as e:
-                print(f"Error initializing pynput: {e}")
-                import traceback
-                traceback.print_exc()
-                self.status_item.setTitle_("🎤")
-                self.is_running = False
-                self.build_menu()
-                return
+            self._set_status("live")
             
-            # Start keyboard monitoring using NSEvent (native macOS, no pynput)
+            # Start keyboard monitoring using a CGEventTap (native macOS, no pynput)
             try:
                 self._start_nsevent_monitoring()
-                print("NSEvent keyboard monitoring started")
+                print("Keyboard monitoring started")
             except Exception as e:
                 print(f"Error starting keyboard monitoring: {e}")
-                import traceback
                 traceback.print_exc()
-                self.status_item.setTitle_("🎤")
+                self._set_status("idle")
                 self.is_running = False
-                self.build_menu()
+                self._update_toggle_item()
                 return
             
-            self.build_menu()
+            self._update_toggle_item()
         except Exception as e:
-            print(f"Error in _model_loaded: {e}")
-            import traceback
+            print(f"Error in modelLoaded: {e}")
             traceback.print_exc()
             self.is_running = False
-            self.status_item.setTitle_("🎤")
-            self.build_menu()
+            self._set_status("idle")
+            self._update_toggle_item()
     
-    def _model_load_error(self, error_msg):
-        """Called when model loading fails."""
+    def inputMonitoringDenied(self):
+        """Tell the user the press-to-talk key cannot be seen without Input Monitoring."""
+        self._set_status("warning")
+        alert = NSAlert.alloc().init()
+        alert.setMessageText_("Input Monitoring Required")
+        alert.setInformativeText_(
+            "VoiceType needs Input Monitoring permission to detect the press-to-talk key.\n\n"
+            "Enable it in System Settings > Privacy & Security > Input Monitoring, "
+            "then restart VoiceType."
+        )
+        alert.setAlertStyle_(NSInformationalAlertStyle)
+        alert.addButtonWithTitle_("OK")
+        alert.runModal()
+    
+    def modelLoadError_(self, error_msg):
+        """Called on the main thread when model loading fails; error_msg arrives as an NSString."""
         self.is_running = False
-        self.status_item.setTitle_("🎤")
-        self.build_menu()
+        self._set_status("idle")
+        self._update_toggle_item()
         print(f"Failed to load model: {error_msg}")
     
     def _start_nsevent_monitoring(self):
-        """Start keyboard monitoring using NSEvent (native macOS API)."""
-        # Track previous state to detect changes
-        self.previous_control_state = False
-        
-        # Monitor for modifier key changes (works for ctrl, cmd, alt, shift)
-        self.event_monitor = NSEvent.addGlobalMonitorForEventsMatchingMask_handler_(
-            NSFlagsChangedMask,
-            self._handle_flags_changed
-        )
+        """Start keyboard monitoring with a CGEventTap serviced off the main thread."""
+        # Never leave an earlier tap running where teardown can no longer reach it
+        self._stop_event_monitoring()
+        self._ptt_mask = int(self.press_to_talk_key)
+        self._tap_callback = self._make_flags_handler()
+        
+        ready = threading.Event()
+        threading.Thread(target=self._run_event_tap, args=(ready,), daemon=True).start()
+        ready.wait(timeout=2.0)
         if self.event_monitor:
-            print(f"NSEvent monitor created successfully (monitoring: {self.press_to_talk_key})")
+            print(f"Event tap created successfully (monitoring: {self.press_to_talk_key.label})")
         else:
-            print("Warning: NSEvent monitor is None - may need Input Monitoring permission")
+            print("Warning: event tap is None - may need Input Monitoring permission")
     
-    def _handle_flags_changed(self, event):
-        """Handle modifier key changes."""
+    @objc.python_method
+    def _run_event_tap(self, ready):
+        """Thread body: install a listen-only flags-changed tap and run its CFRunLoop."""
         try:
-            if not self.is_running or not self.voicetype:
-                return event
-            
-            # Get modifier flags
-            flags = event.modifierFlags()
-            
-            # Check which key is being monitored
-            key_pressed = False
-            if self.press_to_talk_key.lower() in ["ctrl", "control"]:
-                key_pressed = (flags & 0x40000) != 0  # Control key
-            elif self.press_to_talk_key.lower() in ["cmd", "command"]:
-                key_pressed = (flags & 0x80000) != 0  # Command key
-            elif self.press_to_talk_key.lower() in ["alt", "option"]:
-                key_pressed = (flags & 0x200000) != 0  # Option/Alt key
-            elif self.press_to_talk_key.lower() == "shift":
-                key_pressed = (flags & 0x20000) != 0  # Shift key
-            
-            # Only act on state changes
-            if key_pressed != self.previous_control_state:
-                self.previous_control_state = key_pressed
+            # Session-level tap: only this login session's modifier changes reach Python.
+            # It sees events whether or not VoiceType is frontmost, so no separate
+            # local NSEvent monitor is needed (or would avoid any callbacks).
+            tap = Quartz.CGEventTapCreate(
+                Quartz.kCGSessionEventTap,
+                Quartz.kCGHeadInsertEventTap,
+                Quartz.kCGEventTapOptionListenOnly,
+                Quartz.CGEventMaskBit(Quartz.kCGEventFlagsChanged),
+                self._tap_callback,
+                None
+            )
+            if tap is None:
+                return
+            source = Quartz.CFMachPortCreateRunLoopSource(None, tap, 0)
+            run_loop = Quartz.CFRunLoopGetCurrent()
+            Quartz.CFRunLoopAddSource(run_loop, source, Quartz.kCFRunLoopCommonModes)
+            Quartz.CGEventTapEnable(tap, True)
+            self.event_monitor = (tap, source)
+            self._tap_run_loop = run_loop
+        finally:
+            ready.set()
+        Quartz.CFRunLoopRun()
+    
+    def _stop_event_monitoring(self):
+        """Disable the event tap and stop its run loop thread."""
+        if self.event_monitor:
+            tap, source = self.event_monitor
+            try:
+                Quartz.CGEventTapEnable(tap, False)
+                # Invalidate the port so the window server drops the tap entirely
+                Quartz.CFMachPortInvalidate(tap)
+                Quartz.CFRunLoopRemoveSource(self._tap_run_loop, source, Quartz.kCFRunLoopCommonModes)
+                Quartz.CFRunLoopStop(self._tap_run_loop)
+            except Exception:
+                pass
+            self.event_monitor = None
+    
+    @objc.python_method
+    def _make_flags_handler(self):
+        """Build the event tap callback with everything it touches bound as locals."""
+        prev_flags = 0
+        last_edge_ns = 0
+        
+        def handle_flags_changed(proxy, event_type, event, refcon,
+                                 _get_flags=Quartz.CGEventGetFlags, _call_after=AppHelper.callAfter,
+                                 _handlers=self._edge_handlers, _mask=self._ptt_mask,
+                                 _now_ns=time.monotonic_ns, _flags_changed=Quartz.kCGEventFlagsChanged):
+            """Event tap callback (tap thread): forward press-to-talk transitions to the main thread."""
+            nonlocal prev_flags, last_edge_ns
+            try:
+                # Anything but a flags change is a tap-disabled notice (the mask admits nothing else):
+                # macOS disables slow taps, so turn it back on rather than going deaf
+                if event_type != _flags_changed:
+                    Quartz.CGEventTapEnable(self.event_monitor[0], True)
+                    return event
                 
-                if key_pressed:
-                    # Key just pressed
-                    if not self.voicetype.is_recording and not self.voicetype.press_to_talk_key_pressed:
-                        now = time.time()
-                        time_since_last = now - self.voicetype.last_toggle_time
-                        if time_since_last >= self.voicetype.toggle_cooldown:
-                            self.voicetype.press_to_talk_key_pressed = True
-                            self.voicetype.start_recording()
-                            print(f"{self.press_to_talk_key} key pressed - Recording started")
-                else:
-                    # Key just released
-                    if self.voicetype.press_to_talk_key_pressed:
-                        self.voicetype.press_to_talk_key_pressed = False
-                        if self.voicetype.is_recording:
-                            self.voicetype.stop_requested = True
-                            self.voicetype.last_toggle_time = time.time()
-                            print(f"{self.press_to_talk_key} key released - Stop requested")
-        except Exception as e:
-            print(f"Error in _handle_flags_changed: {e}")
-            import traceback
-            traceback.print_exc()
+                # Unrelated modifier changes (the common case while typing) return here
+                flags = _get_flags(event)
+                if not (flags ^ prev_flags) & _mask:
+                    return event
+                # Collapse switch chatter: an edge within 5 ms of the last one is not a keystroke.
+                # prev_flags keeps the last dispatched state so the next event reconciles it.
+                now_ns = _now_ns()
+                if now_ns - last_edge_ns < _DEBOUNCE_NS:
+                    return event
+                last_edge_ns = now_ns
+                prev_flags = flags
+                # Index the (released, pressed) handler pair by the new state of the bit
+                _call_after(_handlers[(flags & _mask) != 0])
+            except (AttributeError, TypeError) as e:
+                # Transient while monitoring is being torn down or restarted; report only once,
+                # through the ring buffer so the tap thread never blocks on stderr
+                if not self._error_logged:
+                    self._error_logged = True
+                    self._log_fast(f"Error in handle_flags_changed: {e!r}")
+                    if self._verbose:
+                        traceback.print_exc()
+            
+            return event
         
-        return event
+        return handle_flags_changed
+    
+    @objc.python_method
+    def _log_fast(self, message):
+        """Queue a log line without touching stdout (safe on the event path)."""
+        self._log.append((time.monotonic_ns(), message))
+        self._log_pending.set()
+    
+    @objc.python_method
+    def _drain_log(self):
+        """Thread body: write queued log lines to stdout in 100 ms batches at background QoS."""
+        set_thread_qos(QOS_CLASS_BACKGROUND)
+        log = self._log
+        pending = self._log_pending
+        while True:
+            # Sleep until something is queued, then give the burst time to finish
+            pending.wait()
+            time.sleep(0.1)
+            pending.clear()
+            while log:
+                _, message = log.popleft()
+                sys.stdout.write(message + "\n")
+            sys.stdout.flush()
+    
+    @objc.python_method
+    def _on_key_down(self):
+        """Press-to-talk key pressed (main thread): start recording unless cooling down."""
+        try:
+            vt = self.voicetype
+            if vt is None or not self.is_running:
+                return
+            if not vt.is_recording and not vt.press_to_talk_key_pressed:
+                if time.monotonic_ns() >= vt.next_toggle_ns:
+                    vt.press_to_talk_key_pressed = True
+                    vt.start_recording()
+                    if self._verbose:
+                        self._log_fast(f"{self.press_to_talk_key.label} key pressed - Recording started")
+        except Exception as e:
+            self._log_fast(f"Error in _on_key_down: {e!r}")
+            if self._verbose:
+                traceback.print_exc()
+    
+    @objc.python_method
+    def _on_key_up(self):
+        """Press-to-talk key released (main thread): request the stop."""
+        try:
+            vt = self.voicetype
+            if vt is None or not self.is_running:
+                return
+            if vt.press_to_talk_key_pressed:
+                vt.press_to_talk_key_pressed = False
+                if vt.is_recording:
+                    vt.request_stop()
+                    if self._verbose:
+                        self._log_fast(f"{self.press_to_talk_key.label} key released - Stop requested")
+        except Exception as e:
+            self._log_fast(f"Error in _on_key_up: {e!r}")
+            if self._verbose:
+                traceback.print_exc()
     
     def stopVoicetype_(self, sender):
         """Stop VoiceType."""
@@ -358,23 +649,44 @@ class VoiceTypeApp(NSObject):
             return
         
         self.is_running = False
-        self.status_item.setTitle_("🎤")
+        self._set_status("idle")
         
-        # Stop NSEvent monitoring
-        if hasattr(self, 'event_monitor') and self.event_monitor:
-            try:
-                NSEvent.removeMonitor_(self.event_monitor)
-            except:
-                pass
+        # Stop keyboard monitoring
+        self._stop_event_monitoring()
         
-        # Stop keyboard listener by setting should_exit flag
+        # Keep the model loaded for the next start; only release the microphone
         if self.voicetype:
             self.voicetype.should_exit = True
             if self.voicetype.is_recording:
-                self.voicetype.stop_recording()
+                # The stop worker finishes the recording; never block the main thread on it
+                self.voicetype.request_stop()
+            self.voicetype.suspend()
         
-        self.voicetype = None
-        self.build_menu()
+        self._update_toggle_item()
+    
+    def unloadModel_(self, sender):
+        """Stop VoiceType and free the loaded model; the next start reloads it."""
+        self.stopVoicetype_(None)
+        with self._load_lock:
+            # Also invalidates any load still in flight
+            self._load_generation += 1
+            vt, self.voicetype = self.voicetype, None
+        if vt is not None:
+            vt.close()
+            print("Model unloaded")
+    
+    def toggleComputeType_(self, sender):
+        """Switch the model between int8 and float32 weights, reloading it if running."""
+        compute_type = "float32" if self.config["compute_type"] == "int8" else "int8"
+        self.config["compute_type"] = compute_type
+        save_app_config(self.config)
+        self.int8_item.setState_(1 if compute_type == "int8" else 0)
+        print(f"Model precision set to {compute_type}")
+        
+        was_running = self.is_running
+        self.unloadModel_(None)
+        if was_running:
+            self.startVoicetype_(None)
     
     def showSettings_(self, sender):
         """Show settings window."""
@@ -405,13 +717,11 @@ class VoiceTypeApp(NSObject):
                 print("ERROR: Settings window is None")
         except Exception as e:
             print(f"Error showing settings: {e}")
-            import traceback
             traceback.print_exc()
     
     def terminate_(self, sender):
         """Quit the app."""
-        if self.is_running:
-            self.stopVoicetype_(None)
+        self.unloadModel_(None)
         _release_app_lock()
         NSApp.terminate_(None)
 
@@ -454,7 +764,6 @@ class SettingsWindow(NSWindow):
             print("Settings UI created")
         except Exception as e:
             print(f"Error creating UI: {e}")
-            import traceback
             traceback.print_exc()
         
         return self
@@ -483,17 +792,8 @@ class SettingsWindow(NSWindow):
         
         # Key selection popup
         self.key_popup = NSPopUpButton.alloc().initWithFrame_(NSMakeRect(0, 0, 200, 25))
-        self.key_popup.addItemsWithTitles_(["ctrl", "cmd", "alt", "shift"])
-        current_key = self.app.press_to_talk_key.lower()
-        if current_key in ["ctrl", "control", "cmd", "command", "alt", "option", "shift"]:
-            # Normalize key name
-            if current_key in ["control"]:
-                current_key = "ctrl"
-            elif current_key in ["command"]:
-                current_key = "cmd"
-            elif current_key in ["option"]:
-                current_key = "alt"
-            self.key_popup.selectItemWithTitle_(current_key)
+        self.key_popup.addItemsWithTitles_([key.label for key in PTTKey])
+        self.key_popup.selectItemWithTitle_(self.app.press_to_talk_key.label)
         stack.addView_(self.key_popup)
         
         # Buttons
@@ -522,7 +822,7 @@ class SettingsWindow(NSWindow):
     def saveSettings_(self, sender):
         """Save settings."""
         try:
-            new_key = self.key_popup.selectedItem().title()
+            new_key = _to_ptt_key(self.key_popup.selectedItem().title())
             
             # Update app config
             self.app.config["press_to_talk_key"] = new_key
@@ -533,13 +833,8 @@ class SettingsWindow(NSWindow):
                 # If running, need to restart monitoring with new key
                 if self.app.is_running:
                     # Stop current monitoring
-                    if hasattr(self.app, 'event_monitor') and self.app.event_monitor:
-                        try:
-                            NSEvent.removeMonitor_(self.app.event_monitor)
-                        except:
-                            pass
+                    self.app._stop_event_monitoring()
                     # Restart with new key
-                    self.app.previous_control_state = False
                     self.app._start_nsevent_monitoring()
                 
                 self.close()
@@ -551,9 +846,9 @@ class SettingsWindow(NSWindow):
                 alert = NSAlert.alloc().init()
                 alert.setMessageText_("Settings Saved")
                 if self.app.is_running:
-                    alert.setInformativeText_(f"Press-to-talk key changed to: {new_key}\n\nChanges applied immediately.")
+                    alert.setInformativeText_(f"Press-to-talk key changed to: {new_key.label}\n\nChanges applied immediately.")
                 else:
-                    alert.setInformativeText_(f"Press-to-talk key changed to: {new_key}\n\nStart VoiceType to use the new key.")
+                    alert.setInformativeText_(f"Press-to-talk key changed to: {new_key.label}\n\nStart VoiceType to use the new key.")
                 alert.setAlertStyle_(NSInformationalAlertStyle)
                 alert.addButtonWithTitle_("OK")
                 alert.runModal()
@@ -580,12 +875,19 @@ class SettingsWindow(NSWindow):
             self.app.settings_window = None
 
 
+def _app_signal_handler(signum, frame):
+    _release_app_lock()
+    raise SystemExit(0)
+
+
 def main():
     """Main entry point."""
+    signal.signal(signal.SIGTERM, _app_signal_handler)
+    
     # Check for existing instance
     if not _acquire_app_lock():
         print("⚠️  Another instance of VoiceType is already running.")
-        print(f"   If you're sure no other instance is running, delete: {APP_LOCK_FILE}")
+        print("   Quit it from its menu bar icon first.")
         
         # Show alert
         try:
@@ -595,7 +897,7 @@ def main():
             alert.setMessageText_("VoiceType Already Running")
             alert.setInformativeText_(
                 "Another instance of VoiceType is already running.\n\n"
-                f"If you're sure no other instance is running, delete:\n{APP_LOCK_FILE}"
+                "Quit it from its menu bar icon first."
             )
             alert.setAlertStyle_(NSInformationalAlertStyle)
             alert.addButtonWithTitle_("OK")
@@ -620,7 +922,6 @@ def main():
             _release_app_lock()
     except Exception as e:
         print(f"Error in main: {e}")
-        import traceback
         traceback.print_exc()
         _release_app_lock()
         sys.exit(1)
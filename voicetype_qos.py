@@ -0,0 +1,30 @@
+"""
+Thread quality-of-service helpers shared by the CLI and the menu bar app.
+
+Kept free of heavy imports so the app can use it before the Whisper stack loads.
+"""
+
+import sys
+import ctypes
+
+# macOS qos_class_t values (<sys/qos.h>)
+QOS_CLASS_USER_INTERACTIVE = 0x21
+QOS_CLASS_USER_INITIATED = 0x19
+QOS_CLASS_UTILITY = 0x11
+QOS_CLASS_BACKGROUND = 0x09
+
+
+def set_thread_qos(qos_class):
+    """Set the macOS quality-of-service class of the calling thread; no-op elsewhere.
+    
+    Returns True if the class was applied.
+    """
+    if sys.platform != "darwin":
+        return False
+    try:
+        libc = ctypes.CDLL(None)
+        libc.pthread_set_qos_class_self_np.argtypes = [ctypes.c_uint, ctypes.c_int]
+        libc.pthread_set_qos_class_self_np.restype = ctypes.c_int
+        return libc.pthread_set_qos_class_self_np(qos_class, 0) == 0
+    except Exception:
+        return False